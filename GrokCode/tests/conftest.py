@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py connects and runs auto_migrate at import time, so point it at a scratch
+# SQLite database before the first import.
+_db_dir = tempfile.mkdtemp(prefix='buildersync-tests-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(_db_dir, 'test.db')}")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """The Flask app inside an app context, with every table emptied afterwards."""
+    with app_module.app.app_context():
+        yield app_module.app
+        app_module.db.session.rollback()
+        for table in reversed(app_module.db.metadata.sorted_tables):
+            app_module.db.session.execute(table.delete())
+        app_module.db.session.commit()
+
+
+@pytest.fixture
+def insert(app):
+    """Insert rows with Core and commit. Core inserts skip the after_flush listeners,
+    which issue MySQL-only upserts, so the read paths can be tested on SQLite."""
+    def insert(model, rows):
+        result = app_module.db.session.execute(model.__table__.insert(), rows)
+        app_module.db.session.commit()
+        return result
+    return insert
+
+
+@pytest.fixture
+def count_queries(app):
+    """count_queries(url, user) -> (status code, statements sent while serving GET url)."""
+    client = app.test_client()
+
+    def count_queries(url, user):
+        headers = {'Authorization': f'Bearer {app_module.generate_token(user)}'}
+        result = {}
+
+        def request():
+            result['status'] = client.get(url, headers=headers).status_code
+
+        n = app_module._count_statements(request)
+        return result['status'], n
+    return count_queries
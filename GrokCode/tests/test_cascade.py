@@ -0,0 +1,49 @@
+"""_cascade_from must produce the same dates as the fixed-point loop it replaced."""
+import copy
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import app as app_module
+
+
+def make_tasks(preds, rng):
+    return [SimpleNamespace(id=i + 1, task=f'Task {i + 1}', predecessor_id=pred,
+                            rel_type=rng.choice(['FS', 'SS', 'FF', 'SF']), lag_days=rng.randint(-2, 5),
+                            start_date='2024-03-01',
+                            end_date=app_module._calc_end_from_workdays('2024-03-01', rng.randint(1, 10)))
+            for i, pred in enumerate(preds)]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_cascade_matches_fixed_point_on_random_dags(seed):
+    rng = random.Random(seed)
+    n = rng.randint(2, 60)
+    # Each task hangs off a random earlier task (or none), so the graph is acyclic
+    preds = [None] + [rng.choice([None, rng.randint(1, i)]) for i in range(1, n)]
+    tasks = make_tasks(preds, rng)
+    rng.shuffle(tasks)
+    root_id = rng.randint(1, n)
+    before = {t.id: (t.start_date, t.end_date) for t in tasks}
+    expected = copy.deepcopy(tasks)
+
+    app_module._cascade_from(tasks, root_id)
+    # The old loop re-snapped every linked task in the project; only the root's
+    # downstream tasks are comparable, and nothing else may move.
+    app_module._cascade_fixed_point(expected, root_id)
+
+    downstream = {root_id}
+    for i in range(2, n + 1):  # predecessors always have lower ids
+        if preds[i - 1] in downstream:
+            downstream.add(i)
+    expected = {t.id: (t.start_date, t.end_date) for t in expected}
+    for t in tasks:
+        dates = (t.start_date, t.end_date)
+        assert dates == (expected[t.id] if t.id in downstream else before[t.id]), t.id
+
+
+def test_cascade_raises_on_cycle():
+    tasks = make_tasks([3, 1, 2, None], random.Random(0))
+    with pytest.raises(app_module.ScheduleCycleError):
+        app_module._cascade_from(tasks, 1)
@@ -0,0 +1,73 @@
+"""GET list endpoints must issue the same number of statements however many rows they return."""
+from types import SimpleNamespace
+
+import app as app_module
+
+COMPANY = 1
+ADMIN, PM, CUSTOMER, SUB = 1, 2, 3, 4
+
+
+def seed_people(insert):
+    insert(app_module.Company, [{'id': COMPANY, 'name': 'Query Count Homes'}])
+    insert(app_module.LoginInfo, [
+        {'id': uid, 'username': f'user{uid}@example.com', 'password': 'x', 'firstName': 'Query',
+         'lastName': role.title(), 'role': role, 'company_id': COMPANY}
+        for uid, role in ((ADMIN, 'company_admin'), (PM, 'builder'), (CUSTOMER, 'customer'), (SUB, 'contractor'))
+    ])
+    return SimpleNamespace(id=ADMIN, role='company_admin', company_id=COMPANY)
+
+
+def seed_projects(insert, start, n):
+    insert(app_module.Projects, [
+        {'id': start + i, 'name': f'Project {start + i}', 'company_id': COMPANY, 'project_manager_id': PM,
+         'superintendent_id': PM, 'customer_id': CUSTOMER}
+        for i in range(n)
+    ])
+
+
+def test_get_projects_query_count_is_constant(insert, count_queries):
+    admin = seed_people(insert)
+    url = f'/projects?user_id={ADMIN}&role=company_admin'
+    n = 10
+
+    seed_projects(insert, 1, n)
+    status, small = count_queries(url, admin)
+    assert status == 200
+
+    seed_projects(insert, n + 1, 9 * n)
+    status, large = count_queries(url, admin)
+    assert status == 200
+    assert large == small, (small, large)
+
+
+def seed_change_orders(insert, job_id, start, n):
+    insert(app_module.ChangeOrders, [
+        {'id': start + i, 'job_id': job_id, 'co_number': start + i, 'title': f'CO {start + i}',
+         'status': 'pending_customer', 'sign_order': '["pm", "customer"]', 'current_sign_step': 1}
+        for i in range(n)
+    ])
+    insert(app_module.ChangeOrderLineItem, [
+        {'change_order_id': start + i, 'item_name': 'Upgrade', 'cost': 100, 'sub_id': SUB} for i in range(n)
+    ])
+    insert(app_module.ChangeOrderSignature, [
+        {'change_order_id': start + i, 'user_id': PM, 'role': 'pm', 'signer_name': 'Query Builder'}
+        for i in range(n)
+    ])
+
+
+def test_change_order_lists_query_count_is_constant(insert, count_queries):
+    seed_people(insert)
+    seed_projects(insert, 1, 1)
+    customer = SimpleNamespace(id=CUSTOMER, role='customer', company_id=COMPANY)
+    sub = SimpleNamespace(id=SUB, role='contractor', company_id=COMPANY)
+    cases = [
+        (f'/projects/1/change-orders?user_id={CUSTOMER}&role=customer', customer),
+        (f'/users/{SUB}/change-orders', sub),
+    ]
+
+    seed_change_orders(insert, 1, 1, 10)
+    small = [count_queries(url, user) for url, user in cases]
+    seed_change_orders(insert, 1, 11, 490)
+    large = [count_queries(url, user) for url, user in cases]
+    assert [status for status, _ in small + large] == [200] * 4
+    assert [n for _, n in large] == [n for _, n in small], (small, large)